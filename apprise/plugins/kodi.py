@@ -164,114 +164,125 @@ class NotifyXBMC(NotifyBase):
         # or not.
         self.include_image = include_image
 
-    def _payload_60(self, title, body, notify_type, **kwargs):
-        """Builds payload for KODI API v6.0.
+        # Prepare our notification URL and authentication now; neither
+        # changes between notifications
+        self.notify_url = f"{self.schema}://{self.host}"
+        if self.port:
+            self.notify_url += f":{self.port}"
 
-        Returns (headers, payload)
-        """
+        self.notify_url += "/jsonrpc"
 
-        # prepare JSON Object
-        payload = {
+        self._auth = (self.user, self.password) if self.user else None
+
+        # Tracks our generated URLs; nothing this object builds its URL from
+        # can change after construction
+        self._url_cache = {}
+
+        # Tracks our resolved image urls (keyed by notification type) so we
+        # only ever compute them once
+        self._image_url_cache = {}
+
+        # Pre-build the immutable skeleton of our payload; _payload() only
+        # layers the per-message fields on top of it
+        self._payload_template = {
             "jsonrpc": "2.0",
             "method": "GUI.ShowNotification",
-            "params": {
-                "title": title,
-                "message": body,
-                # displaytime is defined in microseconds so we need to just
-                # do some simple math
-                "displaytime": int(self.duration * 1000),
-            },
             "id": 1,
         }
 
-        # Acquire our image url if configured to do so
-        image_url = (
-            None if not self.include_image else self.image_url(notify_type)
-        )
-
-        if image_url:
-            payload["params"]["image"] = image_url
-            if notify_type is NotifyType.FAILURE:
-                payload["type"] = "error"
-
-            elif notify_type is NotifyType.WARNING:
-                payload["type"] = "warning"
+        self._params_template = {
+            # displaytime is defined in microseconds so we need to just
+            # do some simple math
+            "displaytime": int(self.duration * 1000),
+        }
 
-            else:
-                payload["type"] = "info"
+        # Only the KODI (v6) API supports tagging the notification type
+        # onto the payload; precompute the distinction so a single builder
+        # can serve both protocol versions
+        self._set_type = self.protocol != self.xbmc_remote_protocol
 
-        return (self.headers, dumps(payload))
+        # The schema we re-assemble our URL with is likewise fixed by our
+        # protocol version; derive it once
+        self._base_schema = (
+            self.xbmc_protocol
+            if self.protocol <= self.xbmc_remote_protocol
+            else self.kodi_protocol
+        )
+        if self.secure:
+            # Append 's' to schema
+            self._base_schema += "s"
 
-    def _payload_20(self, title, body, notify_type, **kwargs):
-        """Builds payload for XBMC API v2.0.
+    def _payload(self, title, body, notify_type, **kwargs):
+        """Builds payload for the XBMC API v2.0 and KODI API v6.0.
 
-        Returns (headers, payload)
+        Returns the serialized payload
         """
 
-        # prepare JSON Object
+        # prepare JSON Object; layer our per-message fields over the
+        # templates prepared in __init__
         payload = {
-            "jsonrpc": "2.0",
-            "method": "GUI.ShowNotification",
+            **self._payload_template,
             "params": {
+                **self._params_template,
                 "title": title,
                 "message": body,
-                # displaytime is defined in microseconds so we need to just
-                # do some simple math
-                "displaytime": int(self.duration * 1000),
             },
-            "id": 1,
         }
 
-        # Include our logo if configured to do so
-        image_url = (
-            None if not self.include_image else self.image_url(notify_type)
-        )
+        # Acquire our image url if configured to do so
+        if not self.include_image:
+            image_url = None
+
+        else:
+            try:
+                image_url = self._image_url_cache[notify_type]
+
+            except KeyError:
+                image_url = self._image_url_cache[notify_type] = (
+                    self.image_url(notify_type)
+                )
 
         if image_url:
             payload["params"]["image"] = image_url
 
-        return (self.headers, dumps(payload))
+            # Only the KODI (v6) API supports the notification type
+            if self._set_type:
+                if notify_type is NotifyType.FAILURE:
+                    payload["type"] = "error"
 
-    def send(self, body, title="", notify_type=NotifyType.INFO, **kwargs):
-        """Perform XBMC/KODI Notification."""
-
-        if self.protocol == self.xbmc_remote_protocol:
-            # XBMC v2.0
-            (headers, payload) = self._payload_20(
-                title, body, notify_type, **kwargs
-            )
+                elif notify_type is NotifyType.WARNING:
+                    payload["type"] = "warning"
 
-        else:
-            # KODI v6.0
-            (headers, payload) = self._payload_60(
-                title, body, notify_type, **kwargs
-            )
+                else:
+                    payload["type"] = "info"
 
-        auth = None
-        if self.user:
-            auth = (self.user, self.password)
+        return dumps(payload, separators=(",", ":"))
 
-        url = f"{self.schema}://{self.host}"
-        if self.port:
-            url += f":{self.port}"
+    def send(self, body, title="", notify_type=NotifyType.INFO, **kwargs):
+        """Perform XBMC/KODI Notification."""
 
-        url += "/jsonrpc"
+        # Build our payload
+        payload = self._payload(title, body, notify_type, **kwargs)
 
         self.logger.debug(
-            f"XBMC/KODI POST URL: {url} "
-            f"(cert_verify={self.verify_certificate!r})"
+            "XBMC/KODI POST URL: %s (cert_verify=%r)",
+            self.notify_url,
+            self.verify_certificate,
         )
-        self.logger.debug(f"XBMC/KODI Payload: {payload!s}")
+        self.logger.debug("XBMC/KODI Payload: %s", payload)
 
-        # Always call throttle before any remote server i/o is made
-        self.throttle()
+        # Always call throttle before any remote server i/o is made; our
+        # rate is disabled by default (requests are normally local), so we
+        # can skip the call and its bookkeeping unless one was configured
+        if self.request_rate_per_sec:
+            self.throttle()
 
         try:
             r = requests.post(
-                url,
+                self.notify_url,
                 data=payload,
-                headers=headers,
-                auth=auth,
+                headers=self.headers,
+                auth=self._auth,
                 verify=self.verify_certificate,
                 timeout=self.request_timeout,
                 allow_redirects=self.redirects,
@@ -303,7 +314,7 @@ class NotifyXBMC(NotifyBase):
             self.logger.warning(
                 "A Connection error occurred sending XBMC/KODI notification."
             )
-            self.logger.debug(f"Socket Exception: {e!s}")
+            self.logger.debug("Socket Exception: %s", e)
 
             # Return; we're done
             return False
@@ -317,22 +328,13 @@ class NotifyXBMC(NotifyBase):
 
         Targets or end points should never be identified here.
         """
-        default_schema = (
-            self.xbmc_protocol
-            if (self.protocol <= self.xbmc_remote_protocol)
-            else self.kodi_protocol
-        )
-        if self.secure:
-            # Append 's' to schema
-            default_schema += "s"
-
         port = (
             self.port
             if self.port
             else (443 if self.secure else self.xbmc_default_port)
         )
         return (
-            default_schema,
+            self._base_schema,
             self.user,
             self.password,
             self.host,
@@ -342,6 +344,19 @@ class NotifyXBMC(NotifyBase):
     def url(self, privacy=False, *args, **kwargs):
         """Returns the URL built dynamically based on specified arguments."""
 
+        try:
+            # Our instance is immutable once constructed; serve any URL we
+            # already generated for these arguments
+            return self._url_cache[(privacy, args, tuple(kwargs.items()))]
+
+        except KeyError:
+            # We need to generate our URL below
+            key = (privacy, args, tuple(kwargs.items()))
+
+        except TypeError:
+            # Unhashable arguments; generate our URL without caching
+            key = None
+
         # Define any URL parameters
         params = {
             "image": "yes" if self.include_image else "no",
@@ -354,40 +369,32 @@ class NotifyXBMC(NotifyBase):
         # Determine Authentication
         auth = ""
         if self.user and self.password:
-            auth = "{user}:{password}@".format(
-                user=NotifyXBMC.quote(self.user, safe=""),
-                password=self.pprint(
-                    self.password, privacy, mode=PrivacyMode.Secret, safe=""
-                ),
+            password = self.pprint(
+                self.password, privacy, mode=PrivacyMode.Secret, safe=""
             )
+            auth = f"{NotifyXBMC.quote(self.user, safe='')}:{password}@"
+
         elif self.user:
-            auth = "{user}@".format(
-                user=NotifyXBMC.quote(self.user, safe=""),
-            )
+            auth = f"{NotifyXBMC.quote(self.user, safe='')}@"
 
-        default_schema = (
-            self.xbmc_protocol
-            if (self.protocol <= self.xbmc_remote_protocol)
-            else self.kodi_protocol
-        )
         default_port = 443 if self.secure else self.xbmc_default_port
-        if self.secure:
-            # Append 's' to schema
-            default_schema += "s"
-
-        return "{schema}://{auth}{hostname}{port}/?{params}".format(
-            schema=default_schema,
-            auth=auth,
-            # never encode hostname since we're expecting it to be a valid one
-            hostname=self.host,
-            port=(
-                ""
-                if not self.port or self.port == default_port
-                else f":{self.port}"
-            ),
-            params=NotifyXBMC.urlencode(params),
+        port = (
+            ""
+            if not self.port or self.port == default_port
+            else f":{self.port}"
         )
 
+        # never encode hostname since we're expecting it to be a valid one
+        url = (
+            f"{self._base_schema}://{auth}{self.host}{port}/"
+            f"?{NotifyXBMC.urlencode(params)}"
+        )
+
+        if key is not None:
+            self._url_cache[key] = url
+
+        return url
+
     @staticmethod
     def parse_url(url):
         """Parses the URL and returns enough arguments that can allow us to re-
@@ -61,13 +61,23 @@ PAGERDUTY_SEVERITY_MAP = {
     NotifyType.FAILURE: PagerDutySeverity.CRITICAL,
 }
 
-PAGERDUTY_SEVERITIES = (
-    PagerDutySeverity.INFO,
-    PagerDutySeverity.WARNING,
-    PagerDutySeverity.CRITICAL,
-    PagerDutySeverity.ERROR,
+PAGERDUTY_SEVERITIES = frozenset(
+    [
+        PagerDutySeverity.INFO,
+        PagerDutySeverity.WARNING,
+        PagerDutySeverity.CRITICAL,
+        PagerDutySeverity.ERROR,
+    ]
 )
 
+# Maps every abbreviation of our severities (e.g. 'err' -> 'error') so that
+# user provided over-rides resolve with a single dictionary lookup
+PAGERDUTY_SEVERITY_PREFIX_MAP = {
+    severity[: idx + 1]: severity
+    for severity in PAGERDUTY_SEVERITIES
+    for idx in range(len(severity))
+}
+
 
 # Priorities
 class PagerDutyRegion:
@@ -82,9 +92,11 @@ PAGERDUTY_API_LOOKUP = {
 }
 
 # A List of our regions we can use for verification
-PAGERDUTY_REGIONS = (
-    PagerDutyRegion.US,
-    PagerDutyRegion.EU,
+PAGERDUTY_REGIONS = frozenset(
+    [
+        PagerDutyRegion.US,
+        PagerDutyRegion.EU,
+    ]
 )
 
 
@@ -249,8 +261,6 @@ class NotifyPagerDuty(NotifyBase):
                 )
                 self.logger.warning(msg)
                 raise TypeError(msg)
-        else:
-            self.component = self.template_tokens["source"]["default"]
 
         # An Optional Component
         self.component = self.template_tokens["component"]["default"]
@@ -263,8 +273,6 @@ class NotifyPagerDuty(NotifyBase):
                 )
                 self.logger.warning(msg)
                 raise TypeError(msg)
-        else:
-            self.component = self.template_tokens["component"]["default"]
 
         # Store our region
         try:
@@ -288,14 +296,7 @@ class NotifyPagerDuty(NotifyBase):
         self.severity = (
             None
             if severity is None
-            else next(
-                (
-                    s
-                    for s in PAGERDUTY_SEVERITIES
-                    if str(s).lower().startswith(severity)
-                ),
-                False,
-            )
+            else PAGERDUTY_SEVERITY_PREFIX_MAP.get(severity, False)
         )
 
         if self.severity is False:
@@ -304,6 +305,14 @@ class NotifyPagerDuty(NotifyBase):
             self.logger.warning(msg)
             raise TypeError(msg)
 
+        # Resolve our severities ahead of time; an over-ride (if set) applies
+        # to every notification type, otherwise we fall back to our mapping
+        self._severity_map = (
+            PAGERDUTY_SEVERITY_MAP
+            if not self.severity
+            else dict.fromkeys(PAGERDUTY_SEVERITY_MAP, self.severity)
+        )
+
         # A clickthrough option for notifications
         self.click = click
 
@@ -321,57 +330,82 @@ class NotifyPagerDuty(NotifyBase):
         # Display our Apprise Image
         self.include_image = include_image
 
-        return
+        # Prepare our notification URL based on region now
+        self.notify_url = PAGERDUTY_API_LOOKUP[self.region_name]
 
-    def send(self, body, title="", notify_type=NotifyType.INFO, **kwargs):
-        """Send our PagerDuty Notification."""
+        # Tracks our resolved image urls (keyed by notification type) so we
+        # only ever compute them once
+        self._image_url_cache = {}
 
-        # Prepare our headers
-        headers = {
+        # Our headers never change between sends; prepare them once
+        self._headers = {
             "User-Agent": self.app_id,
             "Content-Type": "application/json",
             "Authorization": f"Token token={self.apikey}",
         }
 
-        # Prepare our persistent_notification.create payload
-        payload = {
+        # Pre-build the immutable portion of our payload; send() only has to
+        # layer the per-message fields (summary, severity, etc) on top of it
+        self._payload_template = {
             # Define our integration key
             "routing_key": self.integration_key,
-            # Prepare our payload
-            "payload": {
-                "summary": body,
-                # Set our severity
-                "severity": (
-                    PAGERDUTY_SEVERITY_MAP[notify_type]
-                    if not self.severity
-                    else self.severity
-                ),
-                # Our Alerting Source/Component
-                "source": self.source,
-                "component": self.component,
-            },
             "client": self.app_id,
             # Our Event Action
             "event_action": self.event_action,
         }
 
-        if self.group:
-            payload["payload"]["group"] = self.group
-
-        if self.class_id:
-            payload["payload"]["class"] = self.class_id
-
         if self.click:
-            payload["links"] = [
+            self._payload_template["links"] = [
                 {
                     "href": self.click,
                 }
             ]
 
+        # The static portion of the nested payload entry
+        self._payload_details_template = {
+            # Our Alerting Source/Component
+            "source": self.source,
+            "component": self.component,
+        }
+
+        if self.group:
+            self._payload_details_template["group"] = self.group
+
+        if self.class_id:
+            self._payload_details_template["class"] = self.class_id
+
+        return
+
+    def send(self, body, title="", notify_type=NotifyType.INFO, **kwargs):
+        """Send our PagerDuty Notification."""
+
+        # Our headers (prepared in __init__)
+        headers = self._headers
+
+        # Prepare our persistent_notification.create payload; layer our
+        # per-message fields over the template prepared in __init__
+        payload = {
+            **self._payload_template,
+            "payload": {
+                "summary": body,
+                # Set our severity
+                "severity": self._severity_map[notify_type],
+                **self._payload_details_template,
+            },
+        }
+
         # Acquire our image url if configured to do so
-        image_url = (
-            None if not self.include_image else self.image_url(notify_type)
-        )
+        if not self.include_image:
+            image_url = None
+
+        else:
+            try:
+                image_url = self._image_url_cache[notify_type]
+
+            except KeyError:
+                image_url = self._image_url_cache[notify_type] = (
+                    self.image_url(notify_type)
+                )
 
         if image_url:
             payload["images"] = [
@@ -382,27 +416,24 @@ class NotifyPagerDuty(NotifyBase):
             ]
 
         if self.details:
-            payload["payload"]["custom_details"] = {}
-            # Apply any provided custom details
-            for k, v in self.details.items():
-                payload["payload"]["custom_details"][k] = v
-
-        # Prepare our URL based on region
-        notify_url = PAGERDUTY_API_LOOKUP[self.region_name]
+            # Apply any provided custom details; the payload is serialized
+            # immediately below, so a reference is safe here
+            payload["payload"]["custom_details"] = self.details
 
         self.logger.debug(
-            "Pager Duty POST URL:"
-            f" {notify_url} (cert_verify={self.verify_certificate!r})"
+            "Pager Duty POST URL: %s (cert_verify=%r)",
+            self.notify_url,
+            self.verify_certificate,
         )
-        self.logger.debug(f"Pager Duty Payload: {payload!s}")
+        self.logger.debug("Pager Duty Payload: %s", payload)
 
         # Always call throttle before any remote server i/o is made
         self.throttle()
 
         try:
             r = requests.post(
-                notify_url,
-                data=dumps(payload),
+                self.notify_url,
+                data=dumps(payload, separators=(",", ":")),
                 headers=headers,
                 verify=self.verify_certificate,
                 timeout=self.request_timeout,
@@ -440,7 +471,7 @@ class NotifyPagerDuty(NotifyBase):
                 "A Connection error occurred sending Pager Duty "
                 f"notification to {self.host}."
             )
-            self.logger.debug(f"Socket Exception: {e!s}")
+            self.logger.debug("Socket Exception: %s", e)
 
             # Return; we're done
             return False
@@ -487,23 +518,19 @@ class NotifyPagerDuty(NotifyBase):
         # Extend our parameters
         params.update(self.url_parameters(privacy=privacy, *args, **kwargs))
 
-        url = (
-            "{schema}://{integration_key}@{apikey}/"
-            "{source}/{component}?{params}"
+        # never encode hostname since we're expecting it to be a valid one
+        integration_key = self.pprint(
+            self.integration_key, privacy, mode=PrivacyMode.Secret, safe=""
         )
+        apikey = self.pprint(
+            self.apikey, privacy, mode=PrivacyMode.Secret, safe=""
+        )
+        source = self.pprint(self.source, privacy, safe="")
+        component = self.pprint(self.component, privacy, safe="")
 
-        return url.format(
-            schema=self.secure_protocol,
-            # never encode hostname since we're expecting it to be a valid one
-            integration_key=self.pprint(
-                self.integration_key, privacy, mode=PrivacyMode.Secret, safe=""
-            ),
-            apikey=self.pprint(
-                self.apikey, privacy, mode=PrivacyMode.Secret, safe=""
-            ),
-            source=self.pprint(self.source, privacy, safe=""),
-            component=self.pprint(self.component, privacy, safe=""),
-            params=NotifyPagerDuty.urlencode(params),
+        return (
+            f"{self.secure_protocol}://{integration_key}@{apikey}/"
+            f"{source}/{component}?{NotifyPagerDuty.urlencode(params)}"
         )
 
     @staticmethod
@@ -516,58 +543,47 @@ class NotifyPagerDuty(NotifyBase):
             # We're done early as we couldn't load the results
             return results
 
+        # Alias our query string arguments and unquote() to save on the
+        # repeated dictionary/attribute lookups below
+        qsd = results["qsd"]
+        unquote = NotifyPagerDuty.unquote
+
         # The 'apikey' makes it easier to use yaml configuration
-        if "apikey" in results["qsd"] and len(results["qsd"]["apikey"]):
-            results["apikey"] = NotifyPagerDuty.unquote(
-                results["qsd"]["apikey"]
-            )
+        if "apikey" in qsd and len(qsd["apikey"]):
+            results["apikey"] = unquote(qsd["apikey"])
         else:
-            results["apikey"] = NotifyPagerDuty.unquote(results["host"])
+            results["apikey"] = unquote(results["host"])
 
         # The 'integrationkey' makes it easier to use yaml configuration
-        if "integrationkey" in results["qsd"] and len(
-            results["qsd"]["integrationkey"]
-        ):
-            results["integrationkey"] = NotifyPagerDuty.unquote(
-                results["qsd"]["integrationkey"]
-            )
+        if "integrationkey" in qsd and len(qsd["integrationkey"]):
+            results["integrationkey"] = unquote(qsd["integrationkey"])
         else:
-            results["integrationkey"] = NotifyPagerDuty.unquote(
-                results["user"]
-            )
+            results["integrationkey"] = unquote(results["user"])
 
-        if "click" in results["qsd"] and len(results["qsd"]["click"]):
-            results["click"] = NotifyPagerDuty.unquote(results["qsd"]["click"])
+        if "click" in qsd and len(qsd["click"]):
+            results["click"] = unquote(qsd["click"])
 
-        if "group" in results["qsd"] and len(results["qsd"]["group"]):
-            results["group"] = NotifyPagerDuty.unquote(results["qsd"]["group"])
+        if "group" in qsd and len(qsd["group"]):
+            results["group"] = unquote(qsd["group"])
 
-        if "class" in results["qsd"] and len(results["qsd"]["class"]):
-            results["class_id"] = NotifyPagerDuty.unquote(
-                results["qsd"]["class"]
-            )
+        if "class" in qsd and len(qsd["class"]):
+            results["class_id"] = unquote(qsd["class"])
 
-        if "severity" in results["qsd"] and len(results["qsd"]["severity"]):
-            results["severity"] = NotifyPagerDuty.unquote(
-                results["qsd"]["severity"]
-            )
+        if "severity" in qsd and len(qsd["severity"]):
+            results["severity"] = unquote(qsd["severity"])
 
         # Acquire our full path
         fullpath = NotifyPagerDuty.split_path(results["fullpath"])
 
         # Get our source
-        if "source" in results["qsd"] and len(results["qsd"]["source"]):
-            results["source"] = NotifyPagerDuty.unquote(
-                results["qsd"]["source"]
-            )
+        if "source" in qsd and len(qsd["source"]):
+            results["source"] = unquote(qsd["source"])
         else:
             results["source"] = fullpath.pop(0) if fullpath else None
 
         # Get our component
-        if "component" in results["qsd"] and len(results["qsd"]["component"]):
-            results["component"] = NotifyPagerDuty.unquote(
-                results["qsd"]["component"]
-            )
+        if "component" in qsd and len(qsd["component"]):
+            results["component"] = unquote(qsd["component"])
         else:
             results["component"] = fullpath.pop(0) if fullpath else None
 
@@ -575,19 +591,14 @@ class NotifyPagerDuty(NotifyBase):
         # over-ride if they wish to to our returned result set and tidy
         # entries by unquoting them
         results["details"] = {
-            NotifyPagerDuty.unquote(x): NotifyPagerDuty.unquote(y)
-            for x, y in results["qsd+"].items()
+            unquote(x): unquote(y) for x, y in results["qsd+"].items()
         }
 
-        if "region" in results["qsd"] and len(results["qsd"]["region"]):
+        if "region" in qsd and len(qsd["region"]):
             # Extract from name to associate with from address
-            results["region_name"] = NotifyPagerDuty.unquote(
-                results["qsd"]["region"]
-            )
+            results["region_name"] = unquote(qsd["region"])
 
         # Include images with our message
-        results["include_image"] = parse_bool(
-            results["qsd"].get("image", True)
-        )
+        results["include_image"] = parse_bool(qsd.get("image", True))
 
         return results
@@ -79,8 +79,10 @@ ZULIP_HTTP_ERROR_MAP = {
     401: "Unauthorized - Invalid Token.",
 }
 
-# Used to break path apart into list of streams
-TARGET_LIST_DELIM = re.compile(r"[ \t\r\n,#\\/]+")
+# Used to break path apart into list of streams; all delimiters are
+# normalized to a space so the split itself can stay on the C-level
+# str.split() rather than dispatching into the regex engine
+TARGET_LIST_DELIM = str.maketrans(dict.fromkeys(" \t\r\n,#\\/", " "))
 
 # Used to detect a streams
 IS_VALID_TARGET_RE = re.compile(r"#?(?P<stream>[A-Z0-9_]{1,32})", re.I)
@@ -184,7 +186,7 @@ class NotifyZulip(NotifyBase):
         self.hostname = self.default_hostname
 
         try:
-            match = VALIDATE_BOTNAME.match(botname.strip())
+            match = VALIDATE_BOTNAME.fullmatch(botname.strip())
             if not match:
                 # let outer exception handle this
                 raise TypeError
@@ -206,7 +208,7 @@ class NotifyZulip(NotifyBase):
             raise TypeError(msg) from err
 
         try:
-            match = VALIDATE_ORG.match(organization.strip())
+            match = VALIDATE_ORG.fullmatch(organization.strip())
             if not match:
                 # let outer exception handle this
                 raise TypeError
@@ -237,22 +239,43 @@ class NotifyZulip(NotifyBase):
             # No streams identified, use default
             self.targets.append(self.default_notification_stream)
 
-    def send(self, body, title="", notify_type=NotifyType.INFO, **kwargs):
-        """Perform Zulip Notification."""
+        # Classify our targets up front; is_email() is regex driven and
+        # its verdict never changes for a given target
+        self._resolved_targets = [
+            (target, is_email(target)) for target in self.targets
+        ]
+
+        # Prepare our notification URL, authentication and headers now as
+        # none of them change between notifications
+        self._url = self.notify_url.format(
+            org=self.organization,
+            hostname=self.hostname,
+        )
+
+        self._auth = (
+            f"{self.botname}-bot@{self.organization}.{self.hostname}",
+            self.token,
+        )
 
-        headers = {
+        self._headers = {
             "User-Agent": self.app_id,
             "Content-Type": "application/x-www-form-urlencoded; charset=utf-8",
         }
 
+        # Tracks our generated URLs; nothing this object builds its URL from
+        # can change after construction
+        self._url_cache = {}
+
+    def send(self, body, title="", notify_type=NotifyType.INFO, **kwargs):
+        """Perform Zulip Notification."""
+
         # error tracking (used for function return)
         has_error = False
 
-        # Prepare our notification URL
-        url = self.notify_url.format(
-            org=self.organization,
-            hostname=self.hostname,
-        )
+        # Our URL, authentication and headers (prepared in __init__)
+        url = self._url
+        auth = self._auth
+        headers = self._headers
 
         # prepare JSON Object
         payload = {
@@ -260,17 +283,7 @@ class NotifyZulip(NotifyBase):
             "content": body,
         }
 
-        # Determine Authentication
-        auth = (
-            f"{self.botname}-bot@{self.organization}.{self.hostname}",
-            self.token,
-        )
-
-        # Create a copy of the target list
-        targets = list(self.targets)
-        while len(targets):
-            target = targets.pop(0)
-            result = is_email(target)
+        for target, result in self._resolved_targets:
             if result:
                 # Send a private message
                 payload["type"] = "private"
@@ -282,10 +295,11 @@ class NotifyZulip(NotifyBase):
             payload["to"] = target if not result else result["full_email"]
 
             self.logger.debug(
-                f"Zulip POST URL: {url} "
-                f"(cert_verify={self.verify_certificate!r})"
+                "Zulip POST URL: %s (cert_verify=%r)",
+                url,
+                self.verify_certificate,
             )
-            self.logger.debug(f"Zulip Payload: {payload!s}")
+            self.logger.debug("Zulip Payload: %s", payload)
 
             # Always call throttle before any remote server i/o is made
             self.throttle()
@@ -331,7 +345,7 @@ class NotifyZulip(NotifyBase):
                     "A Connection error occurred sending Zulip "
                     f"notification to {target}."
                 )
-                self.logger.debug(f"Socket Exception: {e!s}")
+                self.logger.debug("Socket Exception: %s", e)
 
                 # Mark our failure
                 has_error = True
@@ -356,30 +370,47 @@ class NotifyZulip(NotifyBase):
     def url(self, privacy=False, *args, **kwargs):
         """Returns the URL built dynamically based on specified arguments."""
 
+        try:
+            # Our instance is immutable once constructed; serve any URL we
+            # already generated for these arguments
+            return self._url_cache[(privacy, args, tuple(kwargs.items()))]
+
+        except KeyError:
+            # We need to generate our URL below
+            key = (privacy, args, tuple(kwargs.items()))
+
+        except TypeError:
+            # Unhashable arguments; generate our URL without caching
+            key = None
+
         # Our URL parameters
         params = self.url_parameters(privacy=privacy, *args, **kwargs)
 
         # simplify our organization in our URL if we can
-        organization = "{}{}".format(
-            self.organization,
-            (
+        organization = NotifyZulip.quote(
+            self.organization
+            + (
                 f".{self.hostname}"
                 if self.hostname != self.default_hostname
                 else ""
             ),
+            safe="",
         )
 
-        return "{schema}://{botname}@{org}/{token}/{targets}?{params}".format(
-            schema=self.secure_protocol,
-            botname=NotifyZulip.quote(self.botname, safe=""),
-            org=NotifyZulip.quote(organization, safe=""),
-            token=self.pprint(self.token, privacy, safe=""),
-            targets="/".join(
-                [NotifyZulip.quote(x, safe="") for x in self.targets]
-            ),
-            params=NotifyZulip.urlencode(params),
+        botname = NotifyZulip.quote(self.botname, safe="")
+        token = self.pprint(self.token, privacy, safe="")
+        targets = "/".join(NotifyZulip.quote(x, safe="") for x in self.targets)
+
+        url = (
+            f"{self.secure_protocol}://{botname}@{organization}/"
+            f"{token}/{targets}?{NotifyZulip.urlencode(params)}"
         )
 
+        if key is not None:
+            self._url_cache[key] = url
+
+        return url
+
     def __len__(self):
         """Returns the number of targets associated with this notification."""
         return len(self.targets)
@@ -417,13 +448,10 @@ class NotifyZulip(NotifyBase):
         # Support the 'to' variable so that we can support rooms this way too
         # The 'to' makes it easier to use yaml configuration
         if "to" in results["qsd"] and len(results["qsd"]["to"]):
-            results["targets"] += list(
-                filter(
-                    bool,
-                    TARGET_LIST_DELIM.split(
-                        NotifyZulip.unquote(results["qsd"]["to"])
-                    ),
-                )
+            results["targets"] += (
+                NotifyZulip.unquote(results["qsd"]["to"])
+                .translate(TARGET_LIST_DELIM)
+                .split()
             )
 
         return results